@@ -9,13 +9,67 @@ For more information on Manim, visit: https://github.com/ManimCommunity/manim
 Background music: "Can You Hear The Music" by Ludwig Göransson
 """
 
+import math
 from scipy import integrate
+from scipy.fft import rfft, next_fast_len
 import numpy as np
 import matplotlib.pyplot as plt
+from numba import njit, prange
 from manim import *
 
 # export PATH="/usr/local/texlive/2023/bin/universal-darwin:$PATH" Be sure to change the environment variable for latex features.
 
+@njit(cache=True)
+def _niall_scalar(x):
+    """
+    JIT-compiled body of `Animation.Niall` for a single input value.
+    """
+
+    x = x % 400.0 #Implemented to account for periodicity.
+    if x < 50:
+        return 0.0
+    elif x >= 50 and x <= 100:
+        return -2*x + 200
+    elif x > 100 and x <=150:
+        return 100.0
+    elif x > 150 and x < 200:
+        return 0.0
+    elif x >= 200 and x <= 225:
+        return 4*x - 800
+    elif x > 225 and x <= 250:
+        return -4*x + 1000
+    elif x > 250 and x <= 300:
+        return 0.0
+    elif x > 300 and x <= 350:
+        return 100.0
+    else:
+        return 0.0
+
+@njit(cache=True, parallel=True)
+def _niall_vec(x):
+    """
+    Evaluate `_niall_scalar` over a 1-D array of input values in parallel.
+    """
+
+    out = np.empty(x.shape[0])
+    for i in prange(x.shape[0]):
+        out[i] = _niall_scalar(x[i])
+    return out
+
+# Optional exact description of `_niall_scalar` over one period as rows of (x_lo, x_hi, slope, intercept).
+# Set `Animation.segments` to this table to compute the coefficients in closed form instead of by FFT.
+NIALL_SEGMENTS = np.array([
+    [0, 50, 0, 0],
+    [50, 100, -2, 200],
+    [100, 150, 0, 100],
+    [150, 200, 0, 0],
+    [200, 225, 4, -800],
+    [225, 250, -4, 1000],
+    [250, 300, 0, 0],
+    [300, 350, 0, 100],
+    [350, 400, 0, 0],
+], dtype=np.float64)
+
 class Animation(MovingCameraScene):
     """
     A class for animating Fourier series for a custom function on the interval `0 < x < L` using Manim.
@@ -26,8 +80,71 @@ class Animation(MovingCameraScene):
     Attributes:
         - self.Niall (function): Custom input function for Fourier series animation.
         - self.camera (manim.mobject.camera.ThreeDCamera): Camera for rendering the animation.
+        - self.low_lim, self.upper_lim (float): Bounds of one period of the input function.
+        - self.intro_degree (int): Degree of the introductory graph.
+        - self.x_increment (float): Spacing of the points each graph is sampled at.
+        - self.set_range (list): Degrees shown in the degree sweep.
+        - self.breakpoints (list): Points where the pieces of `self.Niall` meet.
+        - self.segments (numpy.ndarray or None): Optional piecewise-linear table describing `self.Niall`.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.low_lim = 0
+        self.upper_lim = 400
+        self.intro_degree = 100
+        self.x_increment = 0.1
+
+        # Set the range for degree values
+        self.set_range = [1, 2, 3, 4, 5, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 95, 100]
+
+        # Points where the pieces of Niall meet, so the FFT can sample jumps as the average of both sides
+        self.breakpoints = [50, 100, 150, 200, 225, 250, 300, 350]
+
+        # For a piecewise-linear Niall, set to its table of pieces (e.g. NIALL_SEGMENTS) to use exact coefficients
+        self.segments = None
+
+        self._precompute_samples(max_degree=max(self.intro_degree, *self.set_range))
+
+    def _precompute_samples(self, max_degree):
+        """
+        Calculate the coefficients, sample grid and Fourier basis the graphs are built from.
+
+        The coefficients are computed once for `max_degree`, since those of any lower degree are a prefix
+        of them, and the Fourier basis is evaluated once on the shared sample grid. The coefficients are
+        taken from `self.Niall` by FFT, or in closed form from `self.segments` when a table is given.
+
+        Args:
+            max_degree (int): The highest degree that will be plotted.
+
+        Returns:
+            None: Sets `self._a0`, `self._an`, `self._bn`, `self._xs`, `self._C` and `self._S`.
+        """
+
+        # The period is always the length of the domain, so the coefficients and the plotted series agree
+        P = self.upper_lim - self.low_lim
+
+        if self.segments is None:
+            self._a0, self._an, self._bn = self.calc_coeffs(max_degree, self.low_lim, self.upper_lim, self.Niall,
+                                                            points=self.breakpoints)
+        else:
+            # The table must describe the same function that is plotted, so compare them inside every piece
+            segments = np.asarray(self.segments, dtype=np.float64)
+            if segments[0, 0] != self.low_lim or segments[-1, 1] != self.upper_lim:
+                raise ValueError("`segments` must span exactly one period, from `low_lim` to `upper_lim`.")
+            for t in (0.25, 0.75):
+                x = segments[:, 0] + t*(segments[:, 1] - segments[:, 0])
+                if not np.allclose(self.Niall(x), segments[:, 2]*x + segments[:, 3]):
+                    raise ValueError("`segments` does not describe the same function as `Niall`.")
+            self._a0, self._an, self._bn = self.calc_coeffs_piecewise_linear(max_degree, segments, P)
+
+        # Sample grid for the full-period graphs, matching the points `axes.plot` would use
+        self._xs = np.append(np.arange(self.low_lim, self.upper_lim, self.x_increment), self.upper_lim)
+
+        # Evaluate the basis on the sample grid once; each degree is then a single matrix-vector product
+        self._C, self._S = self.fourier_basis(self._xs, max_degree, P)
+
     def calc_a0(self, func, low_lim, upper_lim):
         """
         Calculate the constant Fourier term, `a0`.
@@ -86,31 +203,115 @@ class Animation(MovingCameraScene):
         result, error = integrate.quad(lambda x: func(x)*np.sin(2*n*np.pi*x / (upper_lim-low_lim)), low_lim, upper_lim)
         return result * 2/(upper_lim - low_lim)
     
-    def calc_coeffs(self, degree, low_lim, upper_lim, func):
+    def sample_func(self, func, x):
+        """
+        Evaluate the input function at every point of an array.
+
+        Array-aware functions such as `self.Niall` are called once on the whole array. Functions written
+        for a single value (e.g. a plain if/elif chain) are evaluated point by point instead.
+
+        Args:
+            func (callable): The input function.
+            x (numpy.ndarray): The points at which to evaluate the function.
+
+        Returns:
+            numpy.ndarray: The function values, with the same shape as `x`.
+        """
+
+        try:
+            y = np.asarray(func(x), dtype=np.float64)
+            if y.shape == x.shape:
+                return y
+        except (TypeError, ValueError):
+            pass
+        return np.vectorize(func, otypes=[float])(x)
+
+    def calc_coeffs(self, degree, low_lim, upper_lim, func, points=None):
         """
         Calculate the Fourier coefficients up to the given degree.
 
         This function computes the constant term `a0`, and coefficients `a_n` and `b_n` for the given
         degree of the Fourier series representation of the input function over the specified domain.
+        All coefficients are obtained from a single real FFT of the function sampled uniformly over one
+        period, rather than integrating each coefficient separately.
+
+        The result is approximate: this is the trapezoidal rule with `M = max(8*degree, 4096)` samples.
+        For a piecewise-smooth function the error is O((degree/M)^2), provided every jump is listed in
+        `points` and falls on a sample point. Such jumps are sampled as the average of the two one-sided
+        values. For Niall this gives errors of about 2e-3 in `a_n` and `b_n` at degree 100. A jump that
+        is not listed, or that falls between sample points, adds an O(jump/M) error (about 0.1 for Niall).
 
         Args:
             degree (int): The degree of the Fourier series.
             low_lim (float): The lower bound of the domain of the function.
             upper_lim (float): The upper bound of the domain of the function.
-            func (callable): The input function.
+            func (callable): The input function. It is called on the whole array of sample points at once
+                if it supports that, otherwise one point at a time.
+            points (list, optional): Points where the function jumps (default is None).
+
+        Returns:
+            tuple: Tuple containing the constant term `a0`, an array of `a_n` coefficients, and an array
+                of `b_n` coefficients.
+        """
+
+        # Sample one period uniformly; the rfft bins 1..degree are then the (scaled) Fourier coefficients.
+        M = next_fast_len(max(8*degree, 4096))
+        x = np.linspace(low_lim, upper_lim, M, endpoint=False)
+        y = self.sample_func(func, x)
+
+        # Sample jumps that fall on the grid as the average of both sides, so each side counts half.
+        if points is not None:
+            pos = (np.asarray(points, dtype=np.float64) - low_lim) / (upper_lim - low_lim) * M
+            on_grid = np.abs(pos - np.round(pos)) < 1e-6
+            idx = np.round(pos[on_grid]).astype(int) % M
+            delta = 1e-9 * (upper_lim - low_lim)
+            left = x[idx] - delta
+            left[left < low_lim] += upper_lim - low_lim  # The left side of `low_lim` wraps to the end of the period
+            y[idx] = (self.sample_func(func, left) + self.sample_func(func, x[idx] + delta)) / 2
+        Y = rfft(y, workers=-1)
+
+        # Shift the phase so the coefficients refer to `x` rather than `x - low_lim`.
+        n = np.arange(degree + 1)
+        Y = Y[:degree + 1] * np.exp(-2j*np.pi*n*low_lim / (upper_lim - low_lim))
+
+        a0 = Y[0].real / M
+        a_n = 2*Y[1:].real / M
+        b_n = -2*Y[1:].imag / M
+
+        return a0, a_n, b_n
+    
+    def calc_coeffs_piecewise_linear(self, degree, segments, P):
+        """
+        Calculate the exact Fourier coefficients of a piecewise-linear function up to the given degree.
+
+        Each piece contributes closed-form integrals of `(slope*x + intercept)*cos(kx)` and
+        `(slope*x + intercept)*sin(kx)`, evaluated for all harmonics and pieces at once.
+
+        Args:
+            degree (int): The degree of the Fourier series.
+            segments (numpy.ndarray): Rows of `(x_lo, x_hi, slope, intercept)` covering one period.
+            P (float): The period of the function.
 
         Returns:
-            tuple: Tuple containing the constant term `a0`, a list of `a_n` coefficients, and a list
+            tuple: Tuple containing the constant term `a0`, an array of `a_n` coefficients, and an array
                 of `b_n` coefficients.
         """
 
-        a0 = self.calc_a0(func, low_lim, upper_lim)
-        a_n = []
-        b_n = []
-        for n in np.arange(1, degree + 1, 1):
-            a_n.append(self.calc_an(func, n, low_lim, upper_lim))
-            b_n.append(self.calc_bn(func, n, low_lim, upper_lim))
-         
+        x_lo, x_hi, alpha, beta = np.asarray(segments, dtype=np.float64).T
+        a0 = np.sum(alpha*(x_hi**2 - x_lo**2)/2 + beta*(x_hi - x_lo)) / P
+
+        # Harmonics along the rows, pieces along the columns.
+        k = (np.arange(1, degree + 1) * (2*np.pi / P))[:, None]
+
+        def cos_primitive(x):
+            return (alpha*x + beta)*np.sin(k*x)/k + alpha*np.cos(k*x)/k**2
+
+        def sin_primitive(x):
+            return -(alpha*x + beta)*np.cos(k*x)/k + alpha*np.sin(k*x)/k**2
+
+        a_n = 2/P * np.sum(cos_primitive(x_hi) - cos_primitive(x_lo), axis=1)
+        b_n = 2/P * np.sum(sin_primitive(x_hi) - sin_primitive(x_lo), axis=1)
+
         return a0, a_n, b_n
     
     def fourier_series(self, x, degree, a0, an, bn, P):
@@ -121,23 +322,104 @@ class Animation(MovingCameraScene):
         given coefficients.
 
         Args:
-            x (float): The point at which to evaluate the Fourier series.
+            x (float or array_like): The point(s) at which to evaluate the Fourier series.
             degree (int): The degree of the Fourier series.
             a0 (float): The constant term.
-            an (list): List of `a_n` coefficients.
-            bn (list): List of `b_n` coefficients.
+            an (array_like): The `a_n` coefficients.
+            bn (array_like): The `b_n` coefficients.
+            P (float): The period of the Fourier series.
+
+        Returns:
+            float or numpy.ndarray: The Fourier series approximation at the specified point(s).
+        """
+
+        an = np.asarray(an[:degree])
+        bn = np.asarray(bn[:degree])
+
+        # Manim's `axes.plot` evaluates one point at a time. For a few terms a `math` loop beats setting up
+        # numpy arrays; from about degree 15 the dot products are faster.
+        if np.isscalar(x):
+            w = 2*math.pi / P
+            if degree <= 10:
+                result = a0
+                for n, (a, b) in enumerate(zip(an.tolist(), bn.tolist()), 1):
+                    ang = n*w*x
+                    result += a*math.cos(ang) + b*math.sin(ang)
+                return result
+
+            theta = np.arange(1, degree + 1) * (w*x)
+            return a0 + an @ np.cos(theta) + bn @ np.sin(theta)
+
+        x = np.asarray(x)
+        C, S = self.fourier_basis(x.ravel(), degree, P)
+        result = C @ an + S @ bn
+        return a0 + result.reshape(x.shape)
+
+    def fourier_basis(self, x, degree, P):
+        """
+        Evaluate the cosine and sine terms of the Fourier series at the given points.
+
+        Column `n-1` of each matrix holds the `n`-th harmonic, so the series of any degree `d <= degree`
+        at `x` is `a0 + C[:, :d] @ an[:d] + S[:, :d] @ bn[:d]`.
+
+        Args:
+            x (numpy.ndarray): 1-D array of points at which to evaluate the basis.
+            degree (int): The highest harmonic to include.
             P (float): The period of the Fourier series.
 
         Returns:
-            float: The Fourier series approximation at the specified point.
+            tuple: Tuple containing the cosine matrix `C` and sine matrix `S`, each of shape `(len(x), degree)`.
+        """
+
+        theta = np.outer(x, np.arange(1, degree + 1) * (2*np.pi / P))
+        return np.cos(theta), np.sin(theta)
+
+    def plot_samples(self, axes, xs, ys, **kwargs):
+        """
+        Create a curve on the given axes through pre-evaluated points.
+
+        Unlike `axes.plot`, this does not call back into Python for every sample, so a whole curve can
+        be evaluated in one vectorized call beforehand.
+
+        Args:
+            axes (manim.Axes): The axes the points are plotted against.
+            xs (numpy.ndarray): The x-coordinates of the points.
+            ys (numpy.ndarray): The y-coordinates of the points.
+            **kwargs: Additional style arguments passed to `VMobject` (e.g. `color`).
+
+        Returns:
+            manim.VMobject: A smooth curve through the given points.
+        """
+
+        points = axes.c2p(np.column_stack([xs, ys]))
+        return VMobject(**kwargs).set_points_smoothly(points)
+
+    def proportion_to_point(self, curve):
+        """
+        Build a memoized approximation of `curve.point_from_proportion`.
+
+        The dots in `construct` are redrawn on every frame, and `point_from_proportion` re-measures every
+        bezier segment of the curve on each call. Here the cumulative arc length over the curve's anchors is
+        computed once and reused, so each lookup is a binary search. Between anchors the point is linearly
+        interpolated rather than taken on the bezier curve; for the densely sampled graphs in this scene the
+        difference is not visible.
+
+        Args:
+            curve (manim.VMobject): The curve to follow. Its points should not change afterwards.
+
+        Returns:
+            callable: A function mapping a proportion in `[0, 1]` to a point near the curve.
         """
 
-        result = 0
-        for n in range(degree):
-            temp = (an[n]*np.cos(2*(n+1)*np.pi*x / P)) + (bn[n]*np.sin(2*(n+1)*np.pi*x / P))
-            result = result + temp
-            
-        return a0 + result
+        anchors = np.vstack([curve.get_start_anchors(), curve.get_end_anchors()[-1:]])
+        arc = np.concatenate(([0], np.cumsum(np.linalg.norm(np.diff(anchors, axis=0), axis=1))))
+
+        # A curve of zero length has a single position for every proportion
+        if arc[-1] == 0:
+            return lambda alpha: anchors[0].copy()
+
+        arc /= arc[-1]
+        return lambda alpha: np.array([np.interp(alpha, arc, anchors[:, d]) for d in range(anchors.shape[1])])
     
     def plot_graph(self, degree, low_lim, upper_lim, func, func2=None, num_points = 1000):
         """
@@ -145,14 +427,16 @@ class Animation(MovingCameraScene):
 
         This function generates a plot of the Fourier series approximations for the given input function(s).
 
-        Note: The period of the function is assumed to be `upper_lim` - `low_lim`.
+        Note: The period of the function is assumed to be `upper_lim` - `low_lim`. The input functions may
+        take either a single value or a numpy array; array-aware functions are sampled much faster.
 
         Args:
             degree (int): The degree of the Fourier series.
             low_lim (float): The lower bound of the domain of the function.
             upper_lim (float): The upper bound of the domain of the function.
-            func (callable): The input function.
-            func2 (callable, optional): Second input function for comparison (default is None).
+            func (callable): The input function, accepting a float or a numpy array of floats.
+            func2 (callable, optional): Second input function for comparison, with the same requirements
+                as `func` (default is None).
             num_points (int, optional): Number of points for plotting (default is 1000).
 
         Returns:
@@ -177,31 +461,16 @@ class Animation(MovingCameraScene):
         Definition of the custom function 'Niall'.
 
         Args:
-            x (float): The input value.
+            x (float or array_like): The input value(s).
 
         Returns:
-            float: The output value based on the defined function.
+            float or numpy.ndarray: The output value(s) based on the defined function.
         """
 
-        x = x % 400 #Implemented to account for periodicity.
-        if x < 50:
-            return 0
-        elif x >= 50 and x <= 100:
-            return -2*x + 200
-        elif x > 100 and x <=150:
-            return 100
-        elif x > 150 and x < 200:
-            return 0
-        elif x >= 200 and x <= 225:
-            return 4*x - 800
-        elif x > 225 and x <= 250:
-            return -4*x + 1000
-        elif x > 250 and x <= 300:
-            return 0 
-        elif x > 300 and x <= 350:
-            return 100
-        elif x <= 400:
-            return 0
+        if np.isscalar(x):
+            return _niall_scalar(x)
+        x = np.asarray(x, dtype=np.float64)
+        return _niall_vec(x.ravel()).reshape(x.shape)
         
     def construct(self):
         """
@@ -213,11 +482,13 @@ class Animation(MovingCameraScene):
             None: The animation is displayed using Manim.
         """
 
-        low_lim = 0
-        upper_lim = 400
-        P = 400
-        intro_degree = 100
-        x_increment = 0.1
+        low_lim = self.low_lim
+        intro_degree = self.intro_degree
+        x_increment = self.x_increment
+        set_range = self.set_range
+
+        # Coefficients, sample grid and basis are precomputed in `__init__`
+        xs, C, S = self._xs, self._C, self._S
 
         # Save the initial state of the camera frame
         self.camera.frame.save_state()
@@ -234,8 +505,7 @@ class Animation(MovingCameraScene):
         # Create the axes
         axes = Axes(x_range=[0, 415, 415], y_range=[0, 100, 100])
 
-        # Calculate Fourier coefficients for the introductory degree - i.e. the graph that is first shown
-        a0, an, bn = self.calc_coeffs(intro_degree, low_lim, upper_lim, self.Niall)
+        a0, an, bn = self._a0, self._an[:intro_degree], self._bn[:intro_degree]
 
         # Play the animation of drawing the axes
         self.play(DrawBorderThenFill(axes, run_time=1))
@@ -243,14 +513,21 @@ class Animation(MovingCameraScene):
         # ValueTracker for animation control - first portion of graph
         alpha = ValueTracker(0)
 
+        # Evaluate the introductory series once; each introductory graph plots a slice of these samples
+        ys_intro = a0 + C[:, :intro_degree] @ an + S[:, :intro_degree] @ bn
+
+        def intro_plot(start, end):
+            # The tolerance keeps endpoints that lie on the grid despite rounding in `xs`
+            mask = (xs >= start - 1e-6*x_increment) & (xs <= end + 1e-6*x_increment)
+            return self.plot_samples(axes, xs[mask], ys_intro[mask], color=RED)
+
         # Plot the introductory Fourier series graph
-        intro_graph = axes.plot(lambda x: self.fourier_series(x, intro_degree, a0, an, bn, P), color=RED,
-                                x_range=[low_lim, 50, x_increment])
-        graph_skel = axes.plot(lambda x: self.fourier_series(x, intro_degree, a0, an, bn, P), color=RED,
-                            x_range=[low_lim, 400, x_increment])
+        intro_graph = intro_plot(low_lim, 50)
+        graph_skel = intro_plot(low_lim, 400)
 
         # Create a dot that follows the graph
-        dot1 = always_redraw(lambda: Dot(intro_graph.point_from_proportion(alpha.get_value())))
+        intro_point = self.proportion_to_point(intro_graph)
+        dot1 = always_redraw(lambda: Dot(intro_point(alpha.get_value())))
 
         # Scale and move the camera frame
         self.play(self.camera.frame.animate.scale(0.2).move_to(axes.c2p(25, 0)))
@@ -268,9 +545,9 @@ class Animation(MovingCameraScene):
 
         # Create and animate the beta ValueTracker - middle portion of graph
         beta = ValueTracker(0)
-        graph2 = axes.plot(lambda x: self.fourier_series(x, intro_degree, a0, an, bn, P), x_range=[100, 149.7, x_increment],
-                        color=RED)
-        dot2 = always_redraw(lambda: Dot(graph2.point_from_proportion(beta.get_value())))
+        graph2 = intro_plot(100, 149.7)
+        graph2_point = self.proportion_to_point(graph2)
+        dot2 = always_redraw(lambda: Dot(graph2_point(beta.get_value())))
         self.play(self.camera.frame.animate.scale(2).move_to(axes.c2p(125, 100)))
         self.add(graph2, dot2)
         self.play(beta.animate.set_value(1), rate_func=smooth, run_time=4)
@@ -278,9 +555,9 @@ class Animation(MovingCameraScene):
 
         # Create and animate the gamma ValueTracker - for the final portion of graph
         gamma = ValueTracker(0)
-        third_graph = axes.plot(lambda x: self.fourier_series(x, intro_degree, a0, an, bn, P), color=RED,
-                                x_range=[226, 332, x_increment])
-        dot3 = always_redraw(lambda: Dot(third_graph.point_from_proportion(gamma.get_value())))
+        third_graph = intro_plot(226, 332)
+        third_point = self.proportion_to_point(third_graph)
+        dot3 = always_redraw(lambda: Dot(third_point(gamma.get_value())))
         self.play(self.camera.frame.animate.scale(1.5).move_to(axes.c2p(275, 50)))
         self.play(DrawBorderThenFill(third_graph))
         self.add(dot3)
@@ -298,16 +575,12 @@ class Animation(MovingCameraScene):
         self.play(ReplacementTransform(graph_skel, dummy))
         self.play(self.camera.frame.animate.scale(1.3))
 
-        # Set the range for degree values
-        set_range = [1, 2, 3, 4, 5, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 95, 100]
-
         # Iterate through different degrees and plot the corresponding Fourier series graphs
         for i in set_range:
             if i == set_range[0]:
                 # Plot the initial Fourier series graph
-                a0, an, bn = self.calc_coeffs(i, low_lim, upper_lim, self.Niall)
-                G_orig = axes.plot(lambda x: self.fourier_series(x, i, a0, an, bn, P), x_range=[low_lim, upper_lim, x_increment],
-                                color=RED)
+                a0, an, bn = self._a0, self._an[:i], self._bn[:i]
+                G_orig = self.plot_samples(axes, xs, a0 + C[:, :i] @ an + S[:, :i] @ bn, color=RED)
 
                 # Display the title and degree counter
                 title = Text("Fourier Series for Niall").shift(UP * 4.5)
@@ -317,21 +590,19 @@ class Animation(MovingCameraScene):
 
                 continue
 
-            # Plot the subsequent Fourier series graphs
-            a0, an, bn = self.calc_coeffs(i, low_lim, upper_lim, self.Niall)
-            G_new = axes.plot(lambda x: self.fourier_series(x, i, a0, an, bn, P), x_range=[low_lim, upper_lim, x_increment],
-                            color=RED)
+            # Plot the subsequent Fourier series graphs; G_new is only a transform target for the persistent G_orig
+            a0, an, bn = self._a0, self._an[:i], self._bn[:i]
+            G_new = self.plot_samples(axes, xs, a0 + C[:, :i] @ an + S[:, :i] @ bn, color=RED)
             counter_new = Tex(r"\textit{n} = " + str(i)).shift(DOWN * 4)
 
             # Adds the stroke for A when the degree is 20
             if i == 20:
-                line = axes.plot(lambda x: 50, x_range=[212.5, 237.5], color=RED)
-                self.play(ReplacementTransform(G_orig, G_new), ReplacementTransform(counter_orig, counter_new), Create(line))
+                line = Line(axes.c2p(212.5, 50), axes.c2p(237.5, 50), color=RED)
+                self.play(Transform(G_orig, G_new), ReplacementTransform(counter_orig, counter_new), Create(line))
             else:
-                self.play(ReplacementTransform(G_orig, G_new), ReplacementTransform(counter_orig, counter_new))
+                self.play(Transform(G_orig, G_new), ReplacementTransform(counter_orig, counter_new))
 
             # Updates for replacement transform to work correctly in the subsequent loop
-            G_orig = G_new
             counter_orig = counter_new
 
         # Wait for 3 seconds